@@ -17,10 +17,12 @@ logger = logging.getLogger(__name__)
 async def main():
     """Run quantum-enhanced Tor with Stem integration."""
     
-    # Initialize quantum components
+    # Initialize quantum components - seeds load in the background
     logger.info("Initializing quantum cache...")
     quantum_cache = QuantumCache(size=1_000_000)
-    await quantum_cache.preload_seeds_async("cisco_qapi", count=1_000_000)
+    preload_task = asyncio.create_task(
+        quantum_cache.preload_seeds_async("cisco_qapi", count=1_000_000)
+    )
     
     logger.info("Initializing topological timing engine...")
     timing_engine = TopologicalTimingEngine(
@@ -38,6 +40,10 @@ async def main():
         password=None  # Set if Tor control port is password-protected
     )
     
+    # Connect to Tor while the seeds finish loading
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(preload_task, loop.run_in_executor(None, interceptor.connect))
+    
     # Start interception - this hooks into Stem's event system
     logger.info("Starting quantum STREAM_EVENT interception...")
     controller = interceptor.start_interception()
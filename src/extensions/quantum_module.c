@@ -0,0 +1,145 @@
+/*
+ * qtop._quantum - Native batch kernel for topological delay computation
+ * Copyright (C) 2025 Quantum Topology Proxy Project
+ *
+ * Mirrors qtop._timing_kernel: phases come from a SplitMix64 mix of
+ * (circuit_id, packet_hash), delays from the winding-preserving delta
+ * against the circuit's last phase.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <math.h>
+
+/* SplitMix64 constants */
+#define GOLDEN_GAMMA 0x9e3779b97f4a7c15ULL
+#define MIX_1        0xbf58476d1ce4e5b9ULL
+#define MIX_2        0x94d049bb133111ebULL
+
+/* Scale for turning the top 53 bits of a word into a double in [0, 1) */
+#define UNIT_53 (1.0 / 9007199254740992.0)
+
+static inline uint64_t splitmix64(uint64_t x)
+{
+    uint64_t z = x + GOLDEN_GAMMA;
+    z = (z ^ (z >> 30)) * MIX_1;
+    z = (z ^ (z >> 27)) * MIX_2;
+    return z ^ (z >> 31);
+}
+
+/* Floating modulo with Python semantics (result takes the divisor's sign) */
+static inline double py_fmod(double a, double b)
+{
+    double r = fmod(a, b);
+    if (r != 0.0 && ((r < 0.0) != (b < 0.0))) {
+        r += b;
+    }
+    return r;
+}
+
+static int check_buffer(const Py_buffer *buf, const char *name, Py_ssize_t len)
+{
+    if (buf->len != len) {
+        PyErr_Format(PyExc_ValueError, "%s must be %zd bytes, got %zd",
+                     name, len, buf->len);
+        return -1;
+    }
+    return 0;
+}
+
+PyDoc_STRVAR(compute_delays_doc,
+"compute_delays(cids, hashes, states, out, mask, wq, mn, mx)\n"
+"--\n\n"
+"Compute topological delays for a batch of packets in arrival order.\n\n"
+"cids and hashes are 64-bit integer buffers, states is the writable\n"
+"float64 last-phase table indexed by cid & mask and out receives one\n"
+"float64 delay in milliseconds per packet.");
+
+static PyObject *compute_delays(PyObject *self, PyObject *args)
+{
+    Py_buffer cids, hashes, states, out;
+    Py_ssize_t mask;
+    double wq, mn, mx;
+    (void)self;
+
+    if (!PyArg_ParseTuple(args, "y*y*w*w*nddd", &cids, &hashes, &states,
+                          &out, &mask, &wq, &mn, &mx)) {
+        return NULL;
+    }
+
+    PyObject *result = NULL;
+    Py_ssize_t n = cids.len / (Py_ssize_t)sizeof(uint64_t);
+
+    if (cids.len % (Py_ssize_t)sizeof(uint64_t) != 0) {
+        PyErr_SetString(PyExc_ValueError, "cids must hold 64-bit integers");
+        goto done;
+    }
+    if (check_buffer(&hashes, "hashes", cids.len) < 0 ||
+        check_buffer(&out, "out", n * (Py_ssize_t)sizeof(double)) < 0) {
+        goto done;
+    }
+    if (mask < 0 || states.len / (Py_ssize_t)sizeof(double) <= mask) {
+        PyErr_SetString(PyExc_ValueError, "states is smaller than mask + 1");
+        goto done;
+    }
+
+    const uint64_t *c = (const uint64_t *)cids.buf;
+    const uint64_t *h = (const uint64_t *)hashes.buf;
+    double *st = (double *)states.buf;
+    double *o = (double *)out.buf;
+    uint64_t m = (uint64_t)mask;
+
+    Py_BEGIN_ALLOW_THREADS
+
+    /* Pass 1: phases are independent per packet, so this loop vectorizes */
+#pragma GCC ivdep
+    for (Py_ssize_t i = 0; i < n; i++) {
+        uint64_t z = splitmix64((c[i] * GOLDEN_GAMMA) ^ h[i]);
+        o[i] = (double)(z >> 11) * UNIT_53 * wq;
+    }
+
+    /* Pass 2: packets on the same circuit must see the previous phase */
+    for (Py_ssize_t i = 0; i < n; i++) {
+        uint64_t slot = c[i] & m;
+        double phase = o[i];
+        double delta = py_fmod(phase - st[slot], wq);
+        double k = nearbyint(delta / wq);
+        double delay = mn + (k + delta / wq) * (mx - mn) / 10.0;
+
+        delay = delay < mn ? mn : (delay > mx ? mx : delay);
+        st[slot] = phase;
+        o[i] = delay;
+    }
+
+    Py_END_ALLOW_THREADS
+
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+done:
+    PyBuffer_Release(&cids);
+    PyBuffer_Release(&hashes);
+    PyBuffer_Release(&states);
+    PyBuffer_Release(&out);
+    return result;
+}
+
+static PyMethodDef quantum_methods[] = {
+    {"compute_delays", compute_delays, METH_VARARGS, compute_delays_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef quantum_module = {
+    PyModuleDef_HEAD_INIT,
+    "qtop._quantum",
+    "Native kernels for quantum topology proxy",
+    -1,
+    quantum_methods,
+    NULL, NULL, NULL, NULL
+};
+
+PyMODINIT_FUNC PyInit__quantum(void)
+{
+    return PyModule_Create(&quantum_module);
+}
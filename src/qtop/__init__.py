@@ -6,12 +6,9 @@ __version__ = "0.1.0"
 __author__ = "Insider77Circle"
 __email__ = "quantum-proxy@insider77circle.com"
 
-from .core import QuantumTopologyProxy
 from .quantum import QuantumCache
-from .timing import TopologicalTimingEngine
 from .tor import TorCircuitController
 from .monitoring import PrometheusMetrics, HealthChecker
-from .stem_integration import QuantumStemInterceptor
 
 __all__ = [
     "QuantumTopologyProxy",
@@ -22,3 +19,19 @@ __all__ = [
     "HealthChecker",
     "QuantumStemInterceptor",
 ]
+
+
+def __getattr__(name):
+    # Defer the orchestrator, the timing engine (and its Numba import) and the
+    # Stem integration (and its stem import graph) until first use, so
+    # importing a single component stays cheap
+    if name == "QuantumTopologyProxy":
+        from .core import QuantumTopologyProxy
+        return QuantumTopologyProxy
+    if name == "TopologicalTimingEngine":
+        from .timing import TopologicalTimingEngine
+        return TopologicalTimingEngine
+    if name == "QuantumStemInterceptor":
+        from .stem_integration import QuantumStemInterceptor
+        return QuantumStemInterceptor
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,91 @@
+"""
+Compiled kernels for topological delay computation
+"""
+
+import numpy as np
+from numba import njit
+
+# SplitMix64 constants (Steele, Lea & Flood)
+_GOLDEN_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+
+# Scale for turning the top 53 bits of a word into a double in [0, 1)
+_UNIT_53 = 1.0 / (1 << 53)
+
+
+@njit("uint64(uint64)", cache=True)
+def _splitmix64(x):
+    """SplitMix64 finalizer over a uint64 word"""
+    z = x + _GOLDEN_GAMMA
+    z = (z ^ (z >> np.uint64(30))) * _MIX_1
+    z = (z ^ (z >> np.uint64(27))) * _MIX_2
+    return z ^ (z >> np.uint64(31))
+
+
+@njit("float64(uint64, uint64, float64)", cache=True)
+def _quantum_phase(cid, h, wq):
+    """
+    Stateless quantum phase in [0, wq) for a (circuit, packet) pair
+
+    Replaces reseeding the process-global Mersenne Twister per packet; the
+    phase is a pure function of its inputs and touches no shared RNG.
+    """
+    z = _splitmix64((cid * _GOLDEN_GAMMA) ^ h)
+    return (z >> np.uint64(11)) * _UNIT_53 * wq
+
+
+@njit("UniTuple(float64, 2)(uint64, uint64, float64, float64, float64, float64)",
+      cache=True, fastmath=True)
+def _compute(cid, h, last, wq, mn, mx):
+    """
+    Compute delay and new phase for one packet
+
+    Args:
+        cid: Tor circuit identifier
+        h: Hash of packet data
+        last: Last phase recorded for the circuit
+        wq: Winding quantum
+        mn: Minimum delay in milliseconds
+        mx: Maximum delay in milliseconds
+
+    Returns:
+        Tuple of (delay in milliseconds, current phase)
+    """
+    phase = _quantum_phase(cid, h, wq)
+
+    # Phase delta with winding number preservation
+    delta = (phase - last) % wq
+    k = round(delta / wq)
+
+    delay = mn + (k + delta / wq) * (mx - mn) / 10.0
+
+    # Select-based clamp, lowered to minsd/maxsd rather than builtin calls
+    delay = mn if delay < mn else (mx if delay > mx else delay)
+    return delay, phase
+
+
+@njit("void(uint64[::1], uint64[::1], float64[::1], uint64, float64, float64, float64, float64[::1])",
+      cache=True)
+def _compute_batch(cids, hs, states, mask, wq, mn, mx, out):
+    """
+    Compute delays for a batch of packets in arrival order
+
+    The loop stays sequential: packets on the same circuit must see the
+    phase left behind by the previous one.
+
+    Args:
+        cids: uint64 circuit identifiers
+        hs: uint64 packet hashes
+        states: Direct-mapped last-phase array, updated in place
+        mask: Slot mask for states
+        wq: Winding quantum
+        mn: Minimum delay in milliseconds
+        mx: Maximum delay in milliseconds
+        out: float64 output array for delays in milliseconds
+    """
+    for i in range(cids.shape[0]):
+        slot = cids[i] & mask
+        delay, phase = _compute(cids[i], hs[i], states[slot], wq, mn, mx)
+        states[slot] = phase
+        out[i] = delay
@@ -4,11 +4,16 @@ Monitoring and metrics collection for qtop
 
 import logging
 import time
-from typing import Dict, Callable, Any, Optional
+from typing import Dict, Callable, Any, List, Optional, Sequence
 from dataclasses import dataclass, field
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Prometheus client default histogram buckets
+DEFAULT_BUCKETS = (.005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
 @dataclass
 class HealthCheckResult:
     """Result of a health check"""
@@ -19,7 +24,13 @@ class HealthCheckResult:
 
 @dataclass
 class HealthStatus:
-    """Overall health status"""
+    """
+    Overall health status
+    
+    `healthy` and `timestamp` are fixed when the status is built, but the
+    results in `checks` are the checker's pooled objects, which later runs
+    update in place; copy them to keep a point-in-time record.
+    """
     healthy: bool
     checks: Dict[str, HealthCheckResult]
     timestamp: float = field(default_factory=time.time)
@@ -31,7 +42,7 @@ class PrometheusMetrics:
         self.port = port
         self._counters: Dict[str, int] = {}
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, list] = {}
+        self._histograms: Dict[str, "HistogramMetric"] = {}
         self._running = False
         
     def start_server(self) -> None:
@@ -60,8 +71,8 @@ class PrometheusMetrics:
     def histogram(self, name: str, description: str = "", buckets: Optional[list] = None):
         """Get or create a histogram metric"""
         if name not in self._histograms:
-            self._histograms[name] = []
-        return HistogramMetric(self._histograms, name)
+            self._histograms[name] = HistogramMetric(name, buckets or DEFAULT_BUCKETS)
+        return self._histograms[name]
     
     def record_packet_processed(self, circuit_id: int, delay_ms: float) -> None:
         """Record packet processing metrics"""
@@ -108,15 +119,42 @@ class GaugeMetric:
         self.gauges[self.name] = self.get() - amount
 
 class HistogramMetric:
-    """Prometheus histogram metric"""
+    """Prometheus histogram metric with fixed buckets"""
     
-    def __init__(self, histograms: Dict[str, list], name: str):
-        self.histograms = histograms
+    def __init__(self, name: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
         self.name = name
+        # Upper bounds; +Inf is implicit as the final counter
+        self._buckets = np.array(sorted(b for b in buckets if b != float("inf")), dtype=np.float64)
+        self._counts = np.zeros(len(self._buckets) + 1, dtype=np.int64)
+        self._sum = 0.0
+        self._count = 0
     
     def observe(self, value: float) -> None:
         """Observe a value"""
-        self.histograms[self.name].append(value)
+        # First bucket whose upper bound is >= value (Prometheus "le" semantics)
+        self._counts[np.searchsorted(self._buckets, value)] += 1
+        self._sum += value
+        self._count += 1
+    
+    def get_sum(self) -> float:
+        """Get sum of observed values"""
+        return self._sum
+    
+    def get_count(self) -> int:
+        """Get number of observed values"""
+        return self._count
+    
+    def expose(self) -> List[str]:
+        """Render metric in Prometheus text exposition format"""
+        cumulative = np.cumsum(self._counts).tolist()
+        bounds = [repr(float(b)) for b in self._buckets] + ["+Inf"]
+        lines = [
+            f'{self.name}_bucket{{le="{le}"}} {count}'
+            for le, count in zip(bounds, cumulative)
+        ]
+        lines.append(f"{self.name}_sum {self._sum}")
+        lines.append(f"{self.name}_count {self._count}")
+        return lines
 
 class HealthChecker:
     """Health check system"""
@@ -129,6 +167,8 @@ class HealthChecker:
         """Decorator to register a health check"""
         def decorator(func: Callable) -> Callable:
             self._checks[name] = func
+            # One result object per check, updated in place on every run
+            self._results[name] = HealthCheckResult(name=name, healthy=True, message="")
             return func
         return decorator
     
@@ -138,6 +178,7 @@ class HealthChecker:
         
         all_healthy = all(result.healthy for result in self._results.values())
         
+        # Result objects are pooled and updated in place by later runs
         return HealthStatus(
             healthy=all_healthy,
             checks=self._results.copy()
@@ -146,17 +187,11 @@ class HealthChecker:
     def _run_checks(self) -> None:
         """Run all registered health checks"""
         for name, check_func in self._checks.items():
+            result = self._results[name]
             try:
-                healthy, message = check_func()
-                self._results[name] = HealthCheckResult(
-                    name=name,
-                    healthy=healthy,
-                    message=message
-                )
+                result.healthy, result.message = check_func()
             except Exception as e:
                 logger.error(f"Health check '{name}' failed: {e}")
-                self._results[name] = HealthCheckResult(
-                    name=name,
-                    healthy=False,
-                    message=f"Check failed: {e}"
-                )
+                result.healthy = False
+                result.message = f"Check failed: {e}"
+            result.timestamp = time.time()
@@ -3,58 +3,114 @@ Quantum cache and randomness management
 """
 
 import logging
-import hashlib
+import itertools
 from typing import List, Tuple, Optional
 import asyncio
 
+import numpy as np
+import xxhash
+
 logger = logging.getLogger(__name__)
 
+SEED_DIGEST_SIZE = 16
+
+
+def _bulk_seed_digests(indices: np.ndarray) -> np.ndarray:
+    """
+    Hash a block of seed counters in one pass
+
+    Seeds only spread entropy across the cache and are never used as key
+    material, so a fast non-cryptographic hash (XXH3-128) is sufficient.
+
+    Args:
+        indices: Seed counters, hashed as little-endian uint64 words
+
+    Returns:
+        Array of shape (len(indices), 16) holding one XXH3-128 digest per row
+    """
+    counters = indices.astype("<u8", copy=False).tobytes()
+    xxh3_128 = xxhash.xxh3_128_digest
+    digests = b"".join(
+        xxh3_128(counters[offset:offset + 8])
+        for offset in range(0, len(counters), 8)
+    )
+    return np.frombuffer(digests, dtype=np.uint8).reshape(-1, SEED_DIGEST_SIZE)
+
+
 class QuantumCache:
     """Quantum randomness cache manager"""
     
     def __init__(self, size: int = 1_000_000):
         self.size = size
-        self._cache = []
+        # Largest ring: size rounded up to a power of two so the index wraps with a mask
+        self._capacity = 1 << max(size - 1, 0).bit_length()
+        self._cache = np.empty(0, dtype=np.float64)
+        # Plain int counters: `+=` is not atomic, so concurrent draws can
+        # occasionally lose an update and the counts are approximate
         self._hit_count = 0
         self._miss_count = 0
-        self._current_index = 0
+        # next() on itertools.count is atomic under the GIL, so delay worker
+        # threads can draw concurrently without a lock and never share a slot
+        self._ticket = itertools.count()
         
     async def preload_seeds_async(self, source: str, count: int, api_key: Optional[str] = None) -> None:
         """Pre-load quantum seeds from specified source"""
         logger.info(f"Pre-loading {count} quantum seeds from {source}")
-        # Placeholder implementation
-        self._cache = [hashlib.sha256(f"quantum_seed_{i}".encode()).digest() for i in range(count)]
-        logger.info(f"Quantum cache preloaded with {len(self._cache)} seeds")
+        if count <= 0:
+            logger.warning("No quantum seeds requested; cache left unchanged")
+            return
+        
+        # Every slot holds a distinct seed, so each is drawn exactly once per cycle:
+        # count is rounded up to a power of two and capped at the ring capacity
+        slots = min(1 << (count - 1).bit_length(), self._capacity)
+        
+        # Placeholder implementation - hash off the event loop so callers keep dispatching
+        idx = np.arange(slots, dtype=np.uint64)
+        loop = asyncio.get_running_loop()
+        digests = await loop.run_in_executor(None, _bulk_seed_digests, idx)
+        
+        # Top 53 bits of each digest's first little-endian word give a uniform
+        # double in [0, 1), independent of host byte order
+        raw = digests.view("<u8")[:, 0]
+        values = (raw >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+        
+        self._cache = values
+        self._ticket = itertools.count()
+        logger.info(f"Quantum cache preloaded with {slots} seeds")
     
     def get_random(self) -> float:
         """Get quantum random value between 0 and 1"""
-        if not self._cache:
+        # Read the ring once; its length is a power of two, so it masks its own index
+        cache = self._cache
+        if len(cache) == 0:
             self._miss_count += 1
             return 0.5  # Fallback
             
         self._hit_count += 1
-        seed = self._cache[self._current_index % len(self._cache)]
-        self._current_index += 1
-        
-        # Convert to float
-        import struct
-        return struct.unpack('d', seed[:8])[0] % 1.0
+        return cache[next(self._ticket) & (len(cache) - 1)]
     
     def get_complex_amplitude(self) -> Tuple[float, float]:
         """Get complex quantum amplitude"""
-        real = self.get_random() * 2 - 1  # -1 to 1
-        imag = self.get_random() * 2 - 1  # -1 to 1
+        cache = self._cache
+        if len(cache) == 0:
+            self._miss_count += 2
+            return (0.0, 0.0)  # Fallback
+        
+        self._hit_count += 2
+        mask = len(cache) - 1
+        real = cache[next(self._ticket) & mask] * 2 - 1  # -1 to 1
+        imag = cache[next(self._ticket) & mask] * 2 - 1  # -1 to 1
         return (real, imag)
     
     def get_hit_rate(self) -> float:
-        """Get cache hit rate"""
+        """Get cache hit rate (approximate under concurrent draws)"""
         total = self._hit_count + self._miss_count
         return self._hit_count / total if total > 0 else 0.0
     
     def get_hit_count(self) -> int:
-        """Get number of cache hits"""
+        """Get number of cache hits (approximate under concurrent draws)"""
         return self._hit_count
     
     def get_miss_count(self) -> int:
-        """Get number of cache misses"""
+        """Get number of cache misses (approximate under concurrent draws)"""
         return self._miss_count
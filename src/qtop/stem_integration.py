@@ -7,15 +7,20 @@ topological timing delays to defeat ML correlation attacks.
 """
 
 import logging
+import threading
 import time
-from typing import Optional
-from stem import Controller
-from stem.control import EventType
-from stem.response import ControlMessage
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Deque, Optional, Tuple
+
+import numpy as np
 
 from .quantum import QuantumCache
 from .timing import TopologicalTimingEngine
 
+if TYPE_CHECKING:
+    from stem.control import Controller
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,7 +36,10 @@ class QuantumStemInterceptor:
                  quantum_cache: QuantumCache,
                  timing_engine: TopologicalTimingEngine,
                  tor_port: int = 9051,
-                 password: Optional[str] = None):
+                 password: Optional[str] = None,
+                 delay_workers: int = 32,
+                 batch_size: int = 256,
+                 batch_interval: float = 0.001):
         """
         Initialize quantum Stem interceptor.
         
@@ -40,21 +48,48 @@ class QuantumStemInterceptor:
             timing_engine: Topological timing computation engine
             tor_port: Tor control port (default 9051)
             password: Tor control port password (optional)
+            delay_workers: Worker threads that apply delays off Stem's event thread
+            batch_size: Maximum stream events per delay computation batch
+            batch_interval: Seconds between batch flushes (default 1ms)
         """
         self.quantum_cache = quantum_cache
         self.timing_engine = timing_engine
         self.tor_port = tor_port
         self.password = password
-        self.controller: Optional[Controller] = None
+        self.controller: Optional["Controller"] = None
         self._active = False
+        
+        # stem's EventType.STREAM, resolved when interception first starts
+        self._stream_event_type = None
+        
+        # Stem dispatches events serially, so delays are slept on a worker pool
+        # that lives for the duration of each interception
+        self._delay_workers = delay_workers
+        self._delay_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Stream events queued by Stem as (circuit_id, stream_id, arrived_at_ns)
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._pending: Deque[Tuple[int, int, int]] = deque()
+        self._batch_stop = threading.Event()
+        self._batch_thread: Optional[threading.Thread] = None
+        
+        # Bind the listener once so add/remove see the same callable
+        self._listener = self._on_stream_event
+        
+        # Pay kernel compilation now rather than on the first live stream
+        self.timing_engine.warmup()
     
-    def connect(self) -> Controller:
+    def connect(self) -> "Controller":
         """
         Connect to Tor control port via Stem.
         
         Returns:
             Authenticated Stem Controller instance
         """
+        # Stem has a deep import graph, so it is only loaded once a connection is made
+        from stem.control import Controller
+        
         logger.info(f"Connecting to Tor control port {self.tor_port}")
         self.controller = Controller.from_port(port=self.tor_port)
         
@@ -63,10 +98,13 @@ class QuantumStemInterceptor:
         else:
             self.controller.authenticate()
         
+        # Prime Stem's controller caches before events start flowing
+        self.controller.get_version()
+        
         logger.info("Connected and authenticated to Tor control port")
         return self.controller
     
-    def start_interception(self) -> Controller:
+    def start_interception(self) -> "Controller":
         """
         Start intercepting STREAM_EVENT for quantum timing injection.
         
@@ -79,41 +117,101 @@ class QuantumStemInterceptor:
         if not self.controller:
             self.connect()
         
-        def handle_stream_event(event):
-            """
-            Handle STREAM_EVENT - inject quantum timing delay.
-            
-            This function is called by Stem for every stream event.
-            We inject quantum-derived delays to break correlation attacks.
-            """
-            # Only process NEW streams (circuit attachment events)
-            if event.status in ('NEW', 'NEWRESOLVE'):
-                # Get quantum phase for this circuit
-                circuit_id = event.circuit_id
-                stream_id = hash(event.id) if hasattr(event, 'id') else hash(str(event))
-                
-                # Compute quantum-topological delay
-                delay_ms = self.timing_engine.compute_delay(circuit_id, stream_id)
-                
-                # Apply delay (convert milliseconds to seconds)
-                time.sleep(delay_ms / 1000.0)
-                
-                logger.debug(
-                    f"Applied quantum delay {delay_ms:.2f}ms to stream "
-                    f"{stream_id} on circuit {circuit_id}"
-                )
-        
-        # Register event listener - this is the integration point
-        self.controller.add_event_listener(handle_stream_event, EventType.STREAM)
+        if self._stream_event_type is None:
+            from stem.control import EventType
+            self._stream_event_type = EventType.STREAM
+        
+        # Register event listener - this is the integration point. It goes in
+        # first so a failed registration leaves no threads behind; events that
+        # arrive before the batcher starts wait in the queue.
+        self.controller.add_event_listener(self._listener, self._stream_event_type)
+        
+        self._delay_pool = ThreadPoolExecutor(
+            max_workers=self._delay_workers,
+            thread_name_prefix="qtop-delay"
+        )
+        self._batch_stop.clear()
+        self._batch_thread = threading.Thread(
+            target=self._run_batcher,
+            name="qtop-batcher",
+            daemon=True
+        )
+        self._batch_thread.start()
         self._active = True
         
         logger.info("Quantum STREAM_EVENT interception active")
         return self.controller
     
+    def _on_stream_event(self, event) -> None:
+        """
+        Handle STREAM_EVENT - inject quantum timing delay.
+        
+        This method is called by Stem for every stream event.
+        We inject quantum-derived delays to break correlation attacks.
+        """
+        # Only process NEW streams (circuit attachment events)
+        if event.status in ('NEW', 'NEWRESOLVE'):
+            # Stem reports both IDs as decimal strings; unattached streams have no circuit
+            circuit_id = int(event.circ_id or 0)
+            stream_id = int(event.id)
+            
+            # Queue for the batcher, which computes and applies the delay
+            self._pending.append((circuit_id, stream_id, time.perf_counter_ns()))
+    
+    def _run_batcher(self) -> None:
+        """Flush queued stream events every batch interval until stopped."""
+        while not self._batch_stop.wait(self.batch_interval):
+            while self._pending:
+                try:
+                    self._flush_batch()
+                except Exception as e:
+                    # Keep the batcher alive; the failed batch has already been dequeued
+                    logger.error(f"Failed to apply quantum delay batch: {e}")
+    
+    def _flush_batch(self) -> None:
+        """Compute delays for up to batch_size queued events in one kernel call."""
+        n = min(len(self._pending), self.batch_size)
+        batch = [self._pending.popleft() for _ in range(n)]
+        
+        circuit_ids = np.fromiter((item[0] for item in batch), dtype=np.int64, count=n)
+        stream_ids = np.fromiter((item[1] for item in batch), dtype=np.int64, count=n)
+        delays = self.timing_engine.compute_delay_batch(circuit_ids, stream_ids)
+        
+        for (circuit_id, stream_id, arrived_at), delay_ms in zip(batch, delays.tolist()):
+            self._delay_pool.submit(self._apply_delay, circuit_id, stream_id, arrived_at, delay_ms)
+    
+    def _apply_delay(self, circuit_id: int, stream_id: int,
+                     arrived_at: int, delay_ms: float) -> None:
+        """Wait until a computed delay has elapsed since the event arrived."""
+        # Delays still queued when interception stops are dropped
+        if self._batch_stop.is_set():
+            return
+        
+        # Convert milliseconds to nanoseconds; time spent queued counts toward the delay
+        remaining = arrived_at + int(delay_ms * 1_000_000) - time.perf_counter_ns()
+        if remaining > 0:
+            time.sleep(remaining / 1e9)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Applied quantum delay {delay_ms:.2f}ms to stream "
+                f"{stream_id} on circuit {circuit_id}"
+            )
+    
     def stop_interception(self):
         """Stop intercepting events and disconnect."""
         if self.controller and self._active:
-            self.controller.remove_event_listener(EventType.STREAM)
+            self.controller.remove_event_listener(self._listener)
+            self._batch_stop.set()
+            if self._batch_thread:
+                self._batch_thread.join()
+                self._batch_thread = None
+            self._pending.clear()
+            
+            # Queued delays return immediately once stopped, so the workers exit promptly
+            if self._delay_pool:
+                self._delay_pool.shutdown(wait=False)
+                self._delay_pool = None
             self._active = False
             logger.info("Stopped quantum interception")
     
@@ -6,8 +6,46 @@ import logging
 import math
 from typing import Optional
 
+import numpy as np
+
+try:
+    from . import _quantum
+except ImportError:  # C extension not built; batches fall back to Numba
+    _quantum = None
+
+# Numba kernels, imported (and so compiled) on first use rather than with this module
+_kernel = None
+
 logger = logging.getLogger(__name__)
 
+# Tor circuit IDs are small dense integers, so per-circuit state is direct-mapped
+CIRCUIT_STATE_SLOTS = 1 << 16
+
+# Kernels work on unsigned 64-bit words; wider or negative ints are reduced mod 2**64
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+
+
+def _as_uint64(values) -> np.ndarray:
+    """Reduce a sequence of integers to a contiguous uint64 array mod 2**64"""
+    if isinstance(values, np.ndarray):
+        if values.dtype.kind == "u":
+            return np.ascontiguousarray(values, dtype=np.uint64)
+        if values.dtype.kind == "i":
+            return np.ascontiguousarray(values, dtype=np.int64).view(np.uint64)
+    # Reduce Python ints one by one; np.asarray would turn a list mixing small
+    # ints with values >= 2**63 into float64 and lose precision
+    return np.fromiter((int(v) & MASK_64 for v in values), dtype=np.uint64)
+
+
+def _load_kernel():
+    """Import the Numba delay kernels, compiling them on the first call"""
+    global _kernel
+    if _kernel is None:
+        from . import _timing_kernel
+        _kernel = _timing_kernel
+    return _kernel
+
+
 class TopologicalTimingEngine:
     """Computes quantum-topological delays for traffic obfuscation"""
     
@@ -18,7 +56,8 @@ class TopologicalTimingEngine:
         self.winding_quantum = winding_quantum
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self._circuit_states = {}  # circuit_id -> last_phase
+        self._circuit_states = np.zeros(CIRCUIT_STATE_SLOTS, dtype=np.float64)  # last_phase
+        self._mask = CIRCUIT_STATE_SLOTS - 1
     
     def compute_delay(self, circuit_id: int, packet_hash: int) -> float:
         """
@@ -31,30 +70,64 @@ class TopologicalTimingEngine:
         Returns:
             Delay in milliseconds
         """
-        # Get current quantum phase (simplified - would use real quantum randomness)
-        current_phase = self._get_quantum_phase(circuit_id, packet_hash)
-        
-        # Get last phase for this circuit
-        last_phase = self._circuit_states.get(circuit_id, 0.0)
-        
-        # Compute phase delta with winding number preservation
-        delta = (current_phase - last_phase) % self.winding_quantum
-        
-        # Quantize to preserve integer winding
-        k = round(delta / self.winding_quantum)
+        cid = circuit_id & MASK_64
+        slot = cid & self._mask
+        kernel = _kernel or _load_kernel()
+        delay, self._circuit_states[slot] = kernel._compute(
+            cid, packet_hash & MASK_64, self._circuit_states[slot],
+            self.winding_quantum, self.min_delay, self.max_delay
+        )
         
-        # Compute delay based on winding number
-        delay = self.min_delay + (k + delta / self.winding_quantum) * \
-                (self.max_delay - self.min_delay) / 10.0
-        
-        # Clamp to valid range
-        delay = max(self.min_delay, min(self.max_delay, delay))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Computed delay {delay:.2f}ms for circuit {circuit_id}")
+        return delay
+    
+    def compute_delay_batch(self, circuit_ids: np.ndarray, packet_hashes: np.ndarray) -> np.ndarray:
+        """
+        Compute topological delays for a batch of packets
         
-        # Update circuit state
-        self._circuit_states[circuit_id] = current_phase
+        Args:
+            circuit_ids: Tor circuit identifiers, in arrival order
+            packet_hashes: Hashes of packet data, aligned with circuit_ids
+            
+        Returns:
+            Delays in milliseconds, one per packet
+        """
+        cids = _as_uint64(circuit_ids)
+        hashes = _as_uint64(packet_hashes)
+        if len(cids) != len(hashes):
+            raise ValueError(
+                f"circuit_ids and packet_hashes differ in length ({len(cids)} != {len(hashes)})"
+            )
+        delays = np.empty(len(cids), dtype=np.float64)
+        if _quantum is not None:
+            _quantum.compute_delays(
+                cids, hashes, self._circuit_states, delays, self._mask,
+                self.winding_quantum, self.min_delay, self.max_delay
+            )
+        else:
+            kernel = _kernel or _load_kernel()
+            kernel._compute_batch(
+                cids, hashes, self._circuit_states, self._mask,
+                self.winding_quantum, self.min_delay, self.max_delay, delays
+            )
+        return delays
+    
+    def warmup(self) -> None:
+        """
+        Compile the delay kernels ahead of the first packet
         
-        logger.debug(f"Computed delay {delay:.2f}ms for circuit {circuit_id}")
-        return delay
+        Runs each kernel once against scratch state, so circuit phases are
+        left untouched.
+        """
+        kernel = _load_kernel()
+        kernel._compute(0, 0, 0.0, self.winding_quantum, self.min_delay, self.max_delay)
+        if _quantum is None:
+            scratch = np.zeros(1, dtype=np.float64)
+            kernel._compute_batch(
+                np.zeros(1, dtype=np.uint64), np.zeros(1, dtype=np.uint64), scratch, 0,
+                self.winding_quantum, self.min_delay, self.max_delay, np.empty(1, dtype=np.float64)
+            )
     
     def verify_winding(self, circuit_id: int, delay: float) -> bool:
         """
@@ -74,10 +147,3 @@ class TopologicalTimingEngine:
         # In a real implementation, this would verify topological invariants
         # For now, we just check basic bounds
         return True
-    
-    def _get_quantum_phase(self, circuit_id: int, packet_hash: int) -> float:
-        """Get quantum phase for circuit and packet (simplified)"""
-        # This would use real quantum randomness in production
-        import random
-        random.seed(circuit_id + packet_hash)
-        return random.random() * self.winding_quantum
@@ -6,8 +6,32 @@ import logging
 from typing import List, Dict, Optional, Any
 import asyncio
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Starting circuit table capacity, doubled whenever it fills; circuit IDs are slot index + 1
+INITIAL_CIRCUIT_CAPACITY = 16
+
+# Circuit slot states
+CIRCUIT_FREE = 0
+CIRCUIT_ACTIVE = 1
+
+_STATE_NAMES = {CIRCUIT_ACTIVE: "active"}
+
+# Circuit table columns; seeds stay Python ints (or None) so any seed round-trips exactly.
+# _live is the dense list of live slots and _live_pos each slot's index in it, so
+# picking a circuit by position is O(1)
+_CIRCUIT_COLUMNS = (
+    ("_ids", np.int64),
+    ("_path_lengths", np.int32),
+    ("_seeds", object),
+    ("_states", np.uint8),
+    ("_created_at", np.float64),
+    ("_live", np.int64),
+    ("_live_pos", np.int64),
+)
+
 class TorCircuitController:
     """Manages Tor circuits with quantum enhancement"""
     
@@ -15,7 +39,29 @@ class TorCircuitController:
         self.tor_port = tor_port
         self.tor_password = tor_password
         self._connected = False
-        self._active_circuits: Dict[int, Dict[str, Any]] = {}
+        
+        # Active circuits as structure-of-arrays over a growable slab
+        self._reset_slab()
+    
+    def _reset_slab(self) -> None:
+        """Release all circuits and shrink the slab to its initial capacity"""
+        self._cap = INITIAL_CIRCUIT_CAPACITY
+        for name, dtype in _CIRCUIT_COLUMNS:
+            setattr(self, name, np.zeros(self._cap, dtype=dtype))
+        # Stack of free slots, lowest slot on top so live circuits stay packed
+        self._free: List[int] = list(range(self._cap - 1, -1, -1))
+        self._n_used = 0
+    
+    def _grow_slab(self) -> None:
+        """Double the slab capacity, keeping existing slots in place"""
+        old_cap = self._cap
+        self._cap = old_cap * 2
+        for name, dtype in _CIRCUIT_COLUMNS:
+            column = np.zeros(self._cap, dtype=dtype)
+            column[:old_cap] = getattr(self, name)
+            setattr(self, name, column)
+        # Only called once every slot is taken, so the new slots are the free list
+        self._free = list(range(self._cap - 1, old_cap - 1, -1))
     
     async def connect(self) -> None:
         """Connect to Tor control port"""
@@ -29,7 +75,7 @@ class TorCircuitController:
         """Disconnect from Tor control port"""
         logger.info("Disconnecting from Tor control port")
         self._connected = False
-        self._active_circuits.clear()
+        self._reset_slab()
         logger.info("Disconnected from Tor control port")
     
     def is_connected(self) -> bool:
@@ -51,27 +97,68 @@ class TorCircuitController:
         if not self._connected:
             raise RuntimeError("Not connected to Tor")
         
-        # Generate circuit ID (simplified)
-        circuit_id = len(self._active_circuits) + 1
+        if not self._free:
+            self._grow_slab()
+        
+        # Take a free slot; its index determines the circuit ID (simplified)
+        slot = self._free.pop()
+        circuit_id = slot + 1
         
         # Create circuit (placeholder)
-        circuit_info = {
-            "id": circuit_id,
-            "path_length": path_length,
-            "quantum_seed": quantum_seed,
-            "state": "active",
-            "path": [f"relay_{i}" for i in range(path_length)],
-            "created_at": asyncio.get_event_loop().time()
-        }
+        self._ids[slot] = circuit_id
+        self._path_lengths[slot] = path_length
+        self._seeds[slot] = quantum_seed
+        self._states[slot] = CIRCUIT_ACTIVE
+        self._created_at[slot] = asyncio.get_event_loop().time()
         
-        self._active_circuits[circuit_id] = circuit_info
+        self._live[self._n_used] = slot
+        self._live_pos[slot] = self._n_used
+        self._n_used += 1
         
         logger.info(f"Created quantum-enhanced circuit {circuit_id} with path length {path_length}")
         return circuit_id
     
+    def close_circuit(self, circuit_id: int) -> None:
+        """
+        Close an active circuit and release its slot
+        
+        Args:
+            circuit_id: Circuit ID returned by create_quantum_circuit
+        """
+        slot = circuit_id - 1
+        if not 0 <= slot < self._cap or self._states[slot] != CIRCUIT_ACTIVE:
+            raise KeyError(circuit_id)
+        
+        self._states[slot] = CIRCUIT_FREE
+        self._seeds[slot] = None
+        self._free.append(slot)
+        
+        # Swap the last live slot into the closed slot's position
+        self._n_used -= 1
+        pos = self._live_pos[slot]
+        last = self._live[self._n_used]
+        self._live[pos] = last
+        self._live_pos[last] = pos
+        logger.info(f"Closed circuit {circuit_id}")
+    
+    def _active_slots(self) -> np.ndarray:
+        """Get slot indices of active circuits, in slot order"""
+        return np.sort(self._live[:self._n_used])
+    
     def get_active_circuits(self) -> List[Dict[str, Any]]:
         """Get list of active circuits"""
-        return list(self._active_circuits.values())
+        circuits = []
+        for slot in self._active_slots().tolist():
+            path_length = int(self._path_lengths[slot])
+            circuits.append({
+                "id": int(self._ids[slot]),
+                "path_length": path_length,
+                "quantum_seed": self._seeds[slot],
+                "state": _STATE_NAMES[int(self._states[slot])],
+                "path": [f"relay_{i}" for i in range(path_length)],
+                "created_at": float(self._created_at[slot])
+            })
+        return circuits
     
     async def stream_events(self):
         """Stream Tor circuit events (placeholder generator)"""
@@ -85,8 +172,9 @@ class TorCircuitController:
             event_count += 1
             
             # Simulate circuit event
-            if self._active_circuits:
-                circuit_id = list(self._active_circuits.keys())[0]
+            if self._n_used:
+                # Report the lowest live slot; swap-remove leaves _live unordered
+                circuit_id = int(self._ids[self._active_slots()[0]])
                 yield {
                     "type": "CIRC",
                     "id": circuit_id,
@@ -103,8 +191,8 @@ class TorCircuitController:
         while self._connected:
             await asyncio.sleep(0.1)  # Simulate packet arrival
             
-            if self._active_circuits:
-                circuit_id = list(self._active_circuits.keys())[packet_count % len(self._active_circuits)]
+            if self._n_used:
+                circuit_id = int(self._ids[self._live[packet_count % self._n_used]])
                 packet_count += 1
                 
                 yield {
@@ -0,0 +1,116 @@
+"""
+Tests for metrics collection
+"""
+
+from dataclasses import asdict
+
+from qtop.monitoring import HealthChecker, HealthStatus, HistogramMetric, PrometheusMetrics
+
+
+class TestHistogramMetric:
+    def test_le_bucket_semantics(self):
+        """A value equal to a bound counts in that bucket; larger values go to +Inf"""
+        histogram = HistogramMetric("delay", buckets=[1.0, 2.0, 5.0])
+        for value in (0.5, 1.0, 1.5, 2.0, 5.0, 7.0):
+            histogram.observe(value)
+
+        assert histogram.expose() == [
+            'delay_bucket{le="1.0"} 2',
+            'delay_bucket{le="2.0"} 4',
+            'delay_bucket{le="5.0"} 5',
+            'delay_bucket{le="+Inf"} 6',
+            "delay_sum 17.0",
+            "delay_count 6",
+        ]
+
+    def test_explicit_inf_and_unsorted_buckets(self):
+        """Buckets are sorted and an explicit +Inf bound is not duplicated"""
+        histogram = HistogramMetric("h", buckets=[5.0, float("inf"), 1.0])
+        histogram.observe(3.0)
+
+        assert histogram.expose()[:3] == [
+            'h_bucket{le="1.0"} 0',
+            'h_bucket{le="5.0"} 1',
+            'h_bucket{le="+Inf"} 1',
+        ]
+
+    def test_sum_and_count(self):
+        """Sum and count track every observation"""
+        histogram = HistogramMetric("h")
+        for value in (0.25, 3.0, 100.0):
+            histogram.observe(value)
+
+        assert histogram.get_count() == 3
+        assert histogram.get_sum() == 103.25
+
+    def test_registry_returns_same_histogram(self):
+        """PrometheusMetrics keeps one histogram per name across lookups"""
+        metrics = PrometheusMetrics()
+        metrics.record_packet_processed(circuit_id=1, delay_ms=0.2)
+        metrics.record_packet_processed(circuit_id=1, delay_ms=4.0)
+
+        histogram = metrics.histogram("qtop_packet_delay_ms")
+
+        assert histogram.get_count() == 2
+        assert 'qtop_packet_delay_ms_bucket{le="5.0"} 2' in histogram.expose()
+
+
+def _checker(outcomes: dict) -> HealthChecker:
+    """HealthChecker whose checks return (or raise) whatever outcomes[name] holds"""
+    checker = HealthChecker()
+    for name in outcomes:
+        def check(name=name):
+            outcome = outcomes[name]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+        checker.check(name)(check)
+    return checker
+
+
+class TestHealthChecker:
+    def test_status_reports_every_check(self):
+        """A status is healthy only when every check passes"""
+        outcomes = {"tor": (True, "connected"), "cache": (True, "warm")}
+        checker = _checker(outcomes)
+
+        assert checker.get_status().healthy
+
+        outcomes["cache"] = (False, "empty")
+        status = checker.get_status()
+
+        assert not status.healthy
+        assert status.checks["tor"].healthy
+        assert (status.checks["cache"].healthy, status.checks["cache"].message) == (False, "empty")
+
+    def test_failing_check_is_unhealthy(self):
+        """A check that raises is reported unhealthy with the error message"""
+        checker = _checker({"tor": RuntimeError("control port closed")})
+
+        status = checker.get_status()
+
+        assert not status.healthy
+        assert status.checks["tor"].message == "Check failed: control port closed"
+
+    def test_results_are_reused_across_runs(self):
+        """Each check keeps one result object, updated in place by later runs"""
+        outcomes = {"tor": (True, "connected")}
+        checker = _checker(outcomes)
+        first = checker.get_status()
+
+        outcomes["tor"] = (False, "closed")
+        second = checker.get_status()
+
+        assert second.checks["tor"] is first.checks["tor"]
+        assert first.healthy and not second.healthy
+        assert first.checks is not second.checks
+
+    def test_status_is_a_plain_dataclass(self):
+        """HealthStatus keeps its public constructor, repr and asdict fields"""
+        status = _checker({"tor": (True, "connected")}).get_status()
+        built = HealthStatus(healthy=True, checks={}, timestamp=1.0)
+
+        assert asdict(status)["healthy"] is True
+        assert asdict(status)["checks"]["tor"]["message"] == "connected"
+        assert "healthy=True" in repr(built)
+        assert built == HealthStatus(healthy=True, checks={}, timestamp=1.0)
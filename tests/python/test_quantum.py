@@ -0,0 +1,106 @@
+"""
+Tests for the quantum randomness cache
+"""
+
+import asyncio
+import sys
+import threading
+from collections import Counter
+
+import pytest
+
+from qtop.quantum import QuantumCache
+
+
+def _preloaded(size: int, count: int) -> QuantumCache:
+    cache = QuantumCache(size=size)
+    asyncio.run(cache.preload_seeds_async("test", count=count))
+    return cache
+
+
+class TestQuantumCache:
+    @pytest.mark.parametrize("size, count", [(8, 3), (8, 8), (8, 20), (1000, 1000)])
+    def test_each_seed_drawn_once_per_cycle(self, size, count):
+        """Every ring slot holds a distinct seed, so a cycle draws each one exactly once"""
+        cache = _preloaded(size, count)
+        slots = len(cache._cache)
+
+        draws = Counter(cache.get_random() for _ in range(3 * slots))
+
+        assert slots <= cache._capacity
+        assert slots >= min(count, size)
+        assert len(draws) == slots
+        assert set(draws.values()) == {3}
+
+    def test_values_in_unit_interval(self):
+        """Preloaded seeds map to doubles in [0, 1) and amplitudes to [-1, 1)"""
+        cache = _preloaded(4096, 4096)
+
+        values = [cache.get_random() for _ in range(4096)]
+        amplitudes = [cache.get_complex_amplitude() for _ in range(1024)]
+
+        assert all(0.0 <= value < 1.0 for value in values)
+        assert all(-1.0 <= part < 1.0 for pair in amplitudes for part in pair)
+        assert cache.get_hit_count() == 4096 + 2 * 1024
+
+    def test_preload_is_deterministic(self):
+        """The placeholder source yields the same seeds on every preload"""
+        first = _preloaded(64, 64)
+        second = _preloaded(64, 64)
+
+        assert [first.get_random() for _ in range(64)] == [second.get_random() for _ in range(64)]
+
+    @pytest.mark.parametrize("size, capacity", [(0, 1), (1, 1), (2, 2), (3, 4), (1000, 1024)])
+    def test_capacity_is_size_rounded_to_power_of_two(self, size, capacity):
+        """The ring capacity is the smallest power of two holding size seeds"""
+        cache = QuantumCache(size=size)
+
+        assert cache.size == size
+        assert cache._capacity == capacity
+
+    def test_empty_preload_leaves_cache_unchanged(self):
+        """Preloading zero seeds keeps the previous ring"""
+        cache = _preloaded(8, 8)
+        ring = cache._cache
+
+        asyncio.run(cache.preload_seeds_async("test", count=0))
+
+        assert cache._cache is ring
+
+    def test_empty_cache_falls_back_and_counts_misses(self):
+        """Draws from an empty cache return the fallbacks and count as misses"""
+        cache = QuantumCache(size=8)
+
+        assert cache.get_random() == 0.5
+        assert cache.get_complex_amplitude() == (0.0, 0.0)
+        assert cache.get_miss_count() == 3
+        assert cache.get_hit_count() == 0
+        assert cache.get_hit_rate() == 0.0
+
+    def test_concurrent_draws_take_distinct_tickets(self):
+        """Threads drawing one cycle between them never share a ring slot"""
+        cache = _preloaded(1 << 14, 1 << 14)
+        threads = 8
+        per_thread = len(cache._cache) // threads
+        barrier = threading.Barrier(threads)
+        draws = [[] for _ in range(threads)]
+
+        def draw(out):
+            barrier.wait()
+            for _ in range(per_thread):
+                out.append(cache.get_random())
+
+        workers = [threading.Thread(target=draw, args=(out,)) for out in draws]
+        # Switch threads as often as possible to provoke interleaved draws
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        drawn = [value for out in draws for value in out]
+        assert sorted(drawn) == sorted(cache._cache.tolist())
@@ -0,0 +1,224 @@
+"""
+Tests for the Stem STREAM_EVENT interceptor, driven through a fake controller
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+from stem.control import EventType
+
+from qtop.quantum import QuantumCache
+from qtop.stem_integration import QuantumStemInterceptor
+from qtop.timing import TopologicalTimingEngine
+
+
+class FakeController:
+    """Records listener registration the way stem.control.Controller exposes it"""
+
+    def __init__(self, fail_registration: bool = False):
+        self.fail_registration = fail_registration
+        self.listeners = []
+        self.removed = []
+
+    def add_event_listener(self, listener, *events):
+        if self.fail_registration:
+            raise RuntimeError("SETEVENTS rejected")
+        self.listeners.append((listener, events))
+
+    def remove_event_listener(self, listener):
+        self.removed.append(listener)
+
+
+def _interceptor(controller: FakeController, delay_ms: float = 0.1, **kwargs) -> QuantumStemInterceptor:
+    interceptor = QuantumStemInterceptor(
+        QuantumCache(size=16), TopologicalTimingEngine(min_delay=delay_ms, max_delay=delay_ms * 2), **kwargs
+    )
+    interceptor.controller = controller
+    return interceptor
+
+
+def _stream_event(status: str, circ_id: str, stream_id: str) -> SimpleNamespace:
+    return SimpleNamespace(status=status, circ_id=circ_id, id=stream_id)
+
+
+def _record_applied(interceptor: QuantumStemInterceptor) -> list:
+    """Wrap _apply_delay so each applied (circuit_id, stream_id) pair is recorded"""
+    applied = []
+    apply_delay = interceptor._apply_delay
+
+    def recording(circuit_id, stream_id, arrived_at, delay_ms):
+        apply_delay(circuit_id, stream_id, arrived_at, delay_ms)
+        applied.append((circuit_id, stream_id))
+
+    interceptor._apply_delay = recording
+    return applied
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def _qtop_threads():
+    return [t for t in threading.enumerate() if t.name.startswith("qtop-")]
+
+
+class TestQuantumStemInterceptor:
+    def test_preset_controller_is_used_without_connecting(self):
+        """A controller assigned directly is registered for STREAM events"""
+        controller = FakeController()
+        interceptor = _interceptor(controller)
+
+        assert interceptor.start_interception() is controller
+        try:
+            assert controller.listeners == [(interceptor._listener, (EventType.STREAM,))]
+            assert interceptor.is_active()
+        finally:
+            interceptor.stop_interception()
+
+    def test_failed_registration_starts_no_threads(self):
+        """If the listener cannot be registered, no pool or batcher is left running"""
+        interceptor = _interceptor(FakeController(fail_registration=True))
+        running = set(_qtop_threads())
+
+        with pytest.raises(RuntimeError):
+            interceptor.start_interception()
+
+        assert not interceptor.is_active()
+        assert interceptor._delay_pool is None
+        assert interceptor._batch_thread is None
+        assert set(_qtop_threads()) <= running
+
+    def test_batcher_delays_new_streams_only(self):
+        """NEW and NEWRESOLVE streams are delayed; other statuses are ignored"""
+        interceptor = _interceptor(FakeController())
+        applied = _record_applied(interceptor)
+        interceptor.start_interception()
+        try:
+            listener = interceptor._listener
+            listener(_stream_event("NEW", "3", "10"))
+            listener(_stream_event("SUCCEEDED", "3", "11"))
+            listener(_stream_event("NEWRESOLVE", None, "12"))
+
+            assert _wait_for(lambda: len(applied) == 2)
+            assert sorted(applied) == [(0, 12), (3, 10)]
+        finally:
+            interceptor.stop_interception()
+
+    def test_batcher_survives_failed_batch(self):
+        """An exception while flushing a batch is logged and later events still flow"""
+        interceptor = _interceptor(FakeController())
+        applied = _record_applied(interceptor)
+        compute_delay_batch = interceptor.timing_engine.compute_delay_batch
+        calls = []
+
+        def fail_once(circuit_ids, packet_hashes):
+            calls.append(len(circuit_ids))
+            if len(calls) == 1:
+                raise RuntimeError("kernel failure")
+            return compute_delay_batch(circuit_ids, packet_hashes)
+
+        interceptor.timing_engine.compute_delay_batch = fail_once
+        interceptor.start_interception()
+        try:
+            interceptor._listener(_stream_event("NEW", "1", "1"))
+            assert _wait_for(lambda: calls)
+            interceptor._listener(_stream_event("NEW", "2", "2"))
+
+            assert _wait_for(lambda: applied == [(2, 2)])
+            assert interceptor._batch_thread.is_alive()
+        finally:
+            interceptor.stop_interception()
+
+    def test_batches_are_capped_at_batch_size(self):
+        """Each kernel call covers at most batch_size queued events"""
+        interceptor = _interceptor(FakeController(), batch_size=2)
+        applied = _record_applied(interceptor)
+        compute_delay_batch = interceptor.timing_engine.compute_delay_batch
+        sizes = []
+
+        def recording(circuit_ids, packet_hashes):
+            sizes.append(len(circuit_ids))
+            return compute_delay_batch(circuit_ids, packet_hashes)
+
+        interceptor.timing_engine.compute_delay_batch = recording
+        interceptor.start_interception()
+        try:
+            for stream_id in range(5):
+                interceptor._listener(_stream_event("NEW", "1", str(stream_id)))
+
+            assert _wait_for(lambda: len(applied) == 5)
+            assert sum(sizes) == 5
+            assert max(sizes) <= 2
+        finally:
+            interceptor.stop_interception()
+
+    def test_stop_shuts_down_pool_and_restarts(self):
+        """Stopping releases the pool and batcher; a restart brings up fresh ones"""
+        interceptor = _interceptor(FakeController())
+        applied = _record_applied(interceptor)
+        running = set(_qtop_threads())
+
+        interceptor.start_interception()
+        interceptor._listener(_stream_event("NEW", "1", "1"))
+        assert _wait_for(lambda: applied == [(1, 1)])
+        interceptor.stop_interception()
+
+        assert not interceptor.is_active()
+        assert interceptor._delay_pool is None
+        assert interceptor._batch_thread is None
+        assert _wait_for(lambda: set(_qtop_threads()) <= running)
+
+        interceptor.start_interception()
+        try:
+            interceptor._listener(_stream_event("NEW", "2", "2"))
+            assert _wait_for(lambda: applied == [(1, 1), (2, 2)])
+        finally:
+            interceptor.stop_interception()
+
+    def test_stop_drops_queued_delays(self):
+        """Delays still queued on the pool return at once when interception stops"""
+        interceptor = _interceptor(FakeController(), delay_ms=500.0, delay_workers=1)
+        applied = _record_applied(interceptor)
+        interceptor.start_interception()
+        for stream_id in range(4):
+            interceptor._listener(_stream_event("NEW", "1", str(stream_id)))
+        assert _wait_for(lambda: not interceptor._pending)
+        time.sleep(0.05)
+
+        started = time.monotonic()
+        interceptor.stop_interception()
+
+        # One worker serving four 500ms+ delays would take over 2s; only the
+        # delay already sleeping is waited out
+        assert _wait_for(lambda: len(applied) == 4)
+        assert time.monotonic() - started < 1.5
+
+    def test_listener_removed_is_the_one_registered(self):
+        """Each start registers the bound listener once; stop removes that same callable"""
+        controller = FakeController()
+        interceptor = _interceptor(controller)
+
+        for _ in range(2):
+            interceptor.start_interception()
+            interceptor.stop_interception()
+
+        registered = [listener for listener, _ in controller.listeners]
+        assert registered == [interceptor._listener] * 2
+        assert controller.removed == registered
+        assert all(listener is interceptor._listener for listener in controller.removed)
+
+    def test_stop_without_start_is_a_no_op(self):
+        """Stopping an interceptor that never started leaves the controller alone"""
+        controller = FakeController()
+        interceptor = _interceptor(controller)
+
+        interceptor.stop_interception()
+
+        assert controller.removed == []
@@ -0,0 +1,100 @@
+"""
+Tests for the topological timing engine and its delay kernels
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from qtop import timing
+from qtop.timing import TopologicalTimingEngine
+
+
+def _sample_batch(n: int = 4096, seed: int = 7):
+    """Circuit IDs with plenty of repeats, plus full-range 64-bit hashes"""
+    rng = np.random.default_rng(seed)
+    circuit_ids = rng.integers(0, 64, n, dtype=np.int64)
+    packet_hashes = rng.integers(0, 2**64 - 1, n, dtype=np.uint64, endpoint=True)
+    return circuit_ids, packet_hashes
+
+
+class TestTopologicalTimingEngine:
+    def test_delays_within_bounds(self):
+        """Every delay is clamped to [min_delay, max_delay]"""
+        circuit_ids, packet_hashes = _sample_batch()
+        engine = TopologicalTimingEngine(min_delay=1.0, max_delay=1.5)
+
+        delays = engine.compute_delay_batch(circuit_ids, packet_hashes)
+
+        assert delays.min() >= 1.0
+        assert delays.max() <= 1.5
+        assert all(engine.verify_winding(0, delay) for delay in delays.tolist())
+
+    def test_batch_matches_scalar(self):
+        """Batched delays equal per-packet compute_delay calls in arrival order"""
+        circuit_ids, packet_hashes = _sample_batch()
+        batched = TopologicalTimingEngine()
+        scalar = TopologicalTimingEngine()
+
+        delays = batched.compute_delay_batch(circuit_ids, packet_hashes)
+        expected = [
+            scalar.compute_delay(int(cid), int(h))
+            for cid, h in zip(circuit_ids, packet_hashes)
+        ]
+
+        np.testing.assert_allclose(delays, expected, rtol=0, atol=1e-12)
+        np.testing.assert_array_equal(batched._circuit_states, scalar._circuit_states)
+
+    def test_c_extension_matches_numba(self, monkeypatch):
+        """The qtop._quantum kernel agrees with the Numba fallback"""
+        pytest.importorskip("qtop._quantum")
+        circuit_ids, packet_hashes = _sample_batch()
+
+        native = TopologicalTimingEngine()
+        native_delays = native.compute_delay_batch(circuit_ids, packet_hashes)
+
+        monkeypatch.setattr(timing, "_quantum", None)
+        fallback = TopologicalTimingEngine()
+        fallback_delays = fallback.compute_delay_batch(circuit_ids, packet_hashes)
+
+        np.testing.assert_allclose(native_delays, fallback_delays, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(native._circuit_states, fallback._circuit_states, rtol=0, atol=1e-12)
+
+    def test_batch_rejects_mismatched_lengths(self):
+        """compute_delay_batch refuses arrays of different lengths"""
+        engine = TopologicalTimingEngine()
+
+        with pytest.raises(ValueError):
+            engine.compute_delay_batch([1, 2], [3])
+
+    def test_wide_ints_reduced_mod_2_64(self):
+        """IDs and hashes beyond 64 bits wrap instead of overflowing"""
+        wide = TopologicalTimingEngine()
+        narrow = TopologicalTimingEngine()
+
+        assert wide.compute_delay(2**70, 2**64 + 3) == narrow.compute_delay(0, 3)
+        assert wide.compute_delay(1, -1) == narrow.compute_delay(1, 2**64 - 1)
+        np.testing.assert_array_equal(
+            TopologicalTimingEngine().compute_delay_batch([2**70, 1], [2**64 + 3, -1]),
+            TopologicalTimingEngine().compute_delay_batch([0, 1], [3, 2**64 - 1])
+        )
+
+    def test_import_defers_numba(self):
+        """Importing the package and the engine does not load Numba"""
+        code = "import sys, qtop, qtop.timing; assert 'numba' not in sys.modules"
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+
+    def test_warmup_loads_kernels_without_touching_state(self, monkeypatch):
+        """warmup compiles the Numba kernels without recording any phase"""
+        monkeypatch.setattr(timing, "_kernel", None)
+        engine = TopologicalTimingEngine()
+
+        engine.warmup()
+
+        assert timing._kernel is not None
+        assert not engine._circuit_states.any()
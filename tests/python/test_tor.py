@@ -0,0 +1,118 @@
+"""
+Tests for the Tor circuit controller's circuit table
+"""
+
+import asyncio
+
+import pytest
+
+from qtop.tor import INITIAL_CIRCUIT_CAPACITY, TorCircuitController
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+async def _connected_controller() -> TorCircuitController:
+    controller = TorCircuitController()
+    await controller.connect()
+    return controller
+
+
+async def _take_packets(controller: TorCircuitController, count: int) -> list:
+    circuit_ids = []
+    async for packet in controller.stream_packets():
+        circuit_ids.append(packet["circuit_id"])
+        if len(circuit_ids) == count:
+            break
+    return circuit_ids
+
+
+class TestTorCircuitController:
+    def test_closed_slot_is_reused(self):
+        """A closed circuit's slot goes back on the free list and is handed out next"""
+        async def scenario():
+            controller = await _connected_controller()
+            ids = [await controller.create_quantum_circuit() for _ in range(3)]
+            controller.close_circuit(ids[1])
+            return ids, await controller.create_quantum_circuit()
+
+        ids, reused = _run(scenario())
+
+        assert ids == [1, 2, 3]
+        assert reused == 2
+
+    def test_close_unknown_circuit_raises(self):
+        """Closing a circuit that is not active raises KeyError"""
+        async def scenario():
+            controller = await _connected_controller()
+            circuit_id = await controller.create_quantum_circuit()
+            controller.close_circuit(circuit_id)
+            return controller, circuit_id
+
+        controller, circuit_id = _run(scenario())
+
+        with pytest.raises(KeyError):
+            controller.close_circuit(circuit_id)
+        with pytest.raises(KeyError):
+            controller.close_circuit(10_000)
+
+    def test_slab_grows_and_resets(self):
+        """The slab doubles past its initial capacity and shrinks on disconnect"""
+        count = INITIAL_CIRCUIT_CAPACITY * 2 + 1
+
+        async def scenario():
+            controller = await _connected_controller()
+            ids = [await controller.create_quantum_circuit(path_length=2) for _ in range(count)]
+            grown = controller.get_active_circuits()
+            await controller.disconnect()
+            return controller, ids, grown
+
+        controller, ids, grown = _run(scenario())
+
+        assert ids == list(range(1, count + 1))
+        assert [c["id"] for c in grown] == ids
+        assert controller.get_active_circuits() == []
+        assert controller._cap == INITIAL_CIRCUIT_CAPACITY
+
+    def test_seeds_round_trip_exactly(self):
+        """Seeds of any size, and missing seeds, are reported unchanged"""
+        seeds = [None, -1, 0x1234567890abcdef, 2**70 + 5]
+
+        async def scenario():
+            controller = await _connected_controller()
+            for seed in seeds:
+                await controller.create_quantum_circuit(quantum_seed=seed)
+            return controller.get_active_circuits()
+
+        circuits = _run(scenario())
+
+        assert [c["quantum_seed"] for c in circuits] == seeds
+
+    def test_close_swap_removes_live_circuit(self):
+        """Closing a circuit moves the last live circuit into its round-robin position"""
+        async def scenario():
+            controller = await _connected_controller()
+            for _ in range(4):
+                await controller.create_quantum_circuit()
+            controller.close_circuit(2)
+            return controller, await _take_packets(controller, 6)
+
+        controller, packets = _run(scenario())
+
+        assert packets == [1, 4, 3, 1, 4, 3]
+        assert [c["id"] for c in controller.get_active_circuits()] == [1, 3, 4]
+
+    def test_stream_events_report_lowest_live_circuit(self):
+        """After a swap-remove, events still come from the lowest live circuit"""
+        async def scenario():
+            controller = await _connected_controller()
+            for _ in range(3):
+                await controller.create_quantum_circuit()
+            controller.close_circuit(1)
+            async for event in controller.stream_events():
+                return event
+
+        event = _run(scenario())
+
+        assert event["id"] == 2